@@ -0,0 +1,192 @@
+"""
+Embeddable Python API for tasker.
+
+    tracker = TaskTracker("tasks.json")
+    task = tracker.add("Buy groceries")
+    tracker.mark_done(task["id"])
+    open_tasks = tracker.list(status="todo")
+
+Methods return typed values (models.Task, models.TaskChange) and never print or exit:
+invalid input raises KeyError/ValueError and storage failures raise store.StoreError.
+A change that was saved but couldn't be logged issues history.HistoryWarning instead, so
+callers don't retry (and duplicate) it.
+AsyncTaskTracker offers the same methods as coroutines for asyncio services.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from cache import StoreStamp, store_stamp
+from commands import TASK_STATUS_FILTER, count_tasks, create_task, edit_task, remove_task, select_tasks, to_task
+from history import HistoryWarning, record_history, snapshot_store, store_as_of, task_history
+from models import TASK_ID, TASK_STATUS_TYPES, Store, Task, TaskChange
+from store import DEFAULT_PATH, StoreError, read_store, write_store
+
+
+class TaskTracker:
+    """
+    Client for a single task store.
+
+    The store is loaded once and shared across calls; it is only re-read when the file
+    changes on disk (save generation, mtime or size). Each mutation is saved and recorded
+    in the store's history before the method returns. Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PATH) -> None:
+        self.path = Path(path).expanduser().resolve()
+        self._store: Optional[Store] = None
+        self._stamp: Optional[StoreStamp] = None
+        self._before: Optional[Store] = None  # Store as last saved, while there are unsaved changes
+        self._lock = threading.RLock()
+
+    @property
+    def store(self) -> Store:
+        """The shared in-memory store. Treat as read-only; use the methods below to change it."""
+        with self._lock:
+            stamp = store_stamp(self.path)
+            if self._store is None or (self._before is None and stamp != self._stamp):
+                self._store = read_store(self.path)
+                self._stamp = store_stamp(self.path) if stamp is None else stamp
+            return self._store
+
+    def add(self, description: str) -> Task:
+        return self._write(create_task, description)
+
+    def update(
+        self,
+        task_id: TASK_ID,
+        description: Optional[str] = None,
+        status: Optional[TASK_STATUS_TYPES] = None,
+    ) -> Task:
+        return self._write(edit_task, task_id, description, status)
+
+    def delete(self, task_id: TASK_ID) -> Task:
+        return self._write(remove_task, task_id)
+
+    def mark_in_progress(self, task_id: TASK_ID) -> Task:
+        return self.update(task_id, status="in-progress")
+
+    def mark_done(self, task_id: TASK_ID) -> Task:
+        return self.update(task_id, status="done")
+
+    def list(
+        self,
+        task_id: Optional[TASK_ID] = None,
+        status: TASK_STATUS_FILTER = "all",
+        date: Optional[str] = None,
+        as_of: Optional[str] = None,
+    ) -> list[Task]:
+        """Tasks matching the same filters as `tasker list`, in store order."""
+        with self._lock:
+            store = store_as_of(self.path, as_of) if as_of is not None else self.store
+            return [to_task(id, record) for id, record in select_tasks(store, task_id, status, date)]
+
+    def stats(self) -> dict[str, int]:
+        """Task counts per status, plus 'Total'."""
+        with self._lock:
+            return count_tasks(self.store)
+
+    def history(self, task_id: TASK_ID) -> list[TaskChange]:
+        return task_history(self.path, task_id)
+
+    def flush(self) -> None:
+        """Save pending changes and append them to the store's history."""
+        with self._lock:
+            if self._before is None or self._store is None:
+                return
+            write_store(self._store, self.path)
+            # The store is saved: clear the pending state before logging, so a failed history
+            # append is never retried (and duplicated) by a later flush
+            before, self._before = self._before, None
+            self._stamp = store_stamp(self.path)
+            try:
+                record_history(self.path, before, self._store)
+            except StoreError as e:
+                warnings.warn(f"The change was saved, but not recorded in the history: {e}", HistoryWarning)
+
+    def _apply(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Apply a change to the shared store without saving it yet."""
+        with self._lock:
+            store = self.store
+            before = snapshot_store(store) if self._before is None else None
+            result = func(store, *args)
+            self._before = self._before or before
+            return result
+
+    def _write(self, func: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            result = self._apply(func, *args)
+            self.flush()
+            return result
+
+
+class AsyncTaskTracker:
+    """
+    asyncio variant of TaskTracker; every method is a coroutine.
+
+    Store I/O runs in worker threads so it never blocks the event loop. Writes issued
+    concurrently are applied to the shared store one by one and then saved together:
+    each coroutine returns once a save that includes its change has finished.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PATH) -> None:
+        self.tracker = TaskTracker(path)
+        self._flush: Optional[asyncio.Future] = None
+
+    @property
+    def path(self) -> Path:
+        return self.tracker.path
+
+    async def add(self, description: str) -> Task:
+        return await self._write(create_task, description)
+
+    async def update(
+        self,
+        task_id: TASK_ID,
+        description: Optional[str] = None,
+        status: Optional[TASK_STATUS_TYPES] = None,
+    ) -> Task:
+        return await self._write(edit_task, task_id, description, status)
+
+    async def delete(self, task_id: TASK_ID) -> Task:
+        return await self._write(remove_task, task_id)
+
+    async def mark_in_progress(self, task_id: TASK_ID) -> Task:
+        return await self.update(task_id, status="in-progress")
+
+    async def mark_done(self, task_id: TASK_ID) -> Task:
+        return await self.update(task_id, status="done")
+
+    async def list(
+        self,
+        task_id: Optional[TASK_ID] = None,
+        status: TASK_STATUS_FILTER = "all",
+        date: Optional[str] = None,
+        as_of: Optional[str] = None,
+    ) -> list[Task]:
+        return await asyncio.to_thread(self.tracker.list, task_id, status, date, as_of)
+
+    async def stats(self) -> dict[str, int]:
+        return await asyncio.to_thread(self.tracker.stats)
+
+    async def history(self, task_id: TASK_ID) -> list[TaskChange]:
+        return await asyncio.to_thread(self.tracker.history, task_id)
+
+    async def _write(self, func: Callable[..., Any], *args: Any) -> Any:
+        result = await asyncio.to_thread(self.tracker._apply, func, *args)
+        if self._flush is None:
+            self._flush = asyncio.ensure_future(self._flush_soon())
+        # Shielded so one cancelled writer doesn't cancel the save others are waiting on
+        await asyncio.shield(self._flush)
+        return result
+
+    async def _flush_soon(self) -> None:
+        await asyncio.sleep(0)  # Let writers that are already done applying join this save
+        # Writers applied from here on need a later save, so they start a new one
+        self._flush = None
+        await asyncio.to_thread(self.tracker.flush)
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+from store import read_generation, write_text_atomic
+
+CACHE_MAX_ENTRIES = 64
+CACHE_MAX_BYTES = 1 << 20  # Total size of cached output, in characters
+
+StoreStamp = list[int]
+
+
+def cache_path(store_path: Path) -> Path:
+    """Sidecar file holding cached query output (e.g. tasks.json.cache)."""
+    return store_path.with_name(store_path.name + ".cache")
+
+
+def store_stamp(store_path: Path) -> Optional[StoreStamp]:
+    """
+    Identify the current version of a store without parsing it.
+
+    Combines the save generation bumped by save_tasks() with the file's mtime and size,
+    so hand edits to the JSON also invalidate the cache. Returns None if the store is missing.
+
+    Take the stamp *before* loading the store: if the store changes in between, the result
+    is filed under the old stamp and simply never hit, rather than going stale under the new one.
+    """
+    try:
+        stat = store_path.stat()
+    except OSError:
+        return None
+    return [read_generation(store_path), stat.st_mtime_ns, stat.st_size]
+
+
+def cache_key(**query: Any) -> str:
+    """Normalize query parameters into a stable cache key."""
+    return json.dumps(query, sort_keys=True)
+
+
+def get_cached(store_path: Path, key: str, stamp: Optional[StoreStamp]) -> Optional[str]:
+    """Return cached output for key if it was computed from the store version given by stamp."""
+    if stamp is None:
+        return None
+    entries = _read_entries(store_path, stamp)
+    output = entries.get(key)
+    if output is not None and next(reversed(entries)) != key:
+        # Mark as most recently used; polling the same query repeatedly never rewrites the file
+        entries[key] = entries.pop(key)
+        _write_entries(store_path, stamp, entries)
+    return output
+
+
+def put_cached(store_path: Path, key: str, stamp: Optional[StoreStamp], output: str) -> None:
+    """Cache output for key, evicting least recently used entries beyond the size caps."""
+    if stamp is None or len(output) > CACHE_MAX_BYTES:
+        return
+    entries = _read_entries(store_path, stamp)
+    entries.pop(key, None)
+    entries[key] = output
+    total = sum(len(value) for value in entries.values())
+    while len(entries) > CACHE_MAX_ENTRIES or total > CACHE_MAX_BYTES:
+        oldest = next(iter(entries))
+        total -= len(entries.pop(oldest))
+    _write_entries(store_path, stamp, entries)
+
+
+def _read_entries(store_path: Path, stamp: StoreStamp) -> dict[str, str]:
+    """Load cache entries, oldest first; entries for any other store version are discarded."""
+    try:
+        data: Any = json.loads(cache_path(store_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("stamp") != stamp or not isinstance(data.get("entries"), dict):
+        return {}
+    return data["entries"]
+
+
+def _write_entries(store_path: Path, stamp: StoreStamp, entries: dict[str, str]) -> None:
+    # The cache is best effort: a read-only directory just means no caching
+    try:
+        write_text_atomic(cache_path(store_path), json.dumps({"stamp": stamp, "entries": entries}, ensure_ascii=False))
+    except OSError:
+        pass
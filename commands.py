@@ -1,9 +1,15 @@
 import operator
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date as date_type
 from datetime import datetime, timezone
 from inspect import signature
+from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Annotated,
+    Any,
     Callable,
     Literal,
     Optional,
@@ -14,11 +20,17 @@ from typing import (
 
 from tabulate import tabulate
 
-from models import TASK_ID, TASK_STATUS_TYPES
-from store import VALID_STATUSES, Store, TaskRecord
+from cache import cache_key, get_cached, put_cached, store_stamp
+from models import TASK_ID, TASK_STATUS_TYPES, Task
+from store import VALID_STATUSES, Store, StoreError, TaskRecord, read_store
+from watch import watch_store
+
+if TYPE_CHECKING:
+    from api import TaskTracker  # api imports this module's pure task functions
 
 # Used in list_tasks()
 TASK_STATUS_FILTER = Literal["done", "in-progress", "todo", "all"]
+TABLE_FORMAT = "rounded_grid"
 
 queries: dict[str, dict] = {}
 """
@@ -27,7 +39,7 @@ Registry of CLI queries built by @add_query.
 Shape:
   queries: dict[str, QuerySpec]
   QuerySpec: {
-    "command": Callable[..., Any],   # function to execute (e.g. add_task)
+    "command": Callable[..., Any],   # function to execute with a TaskTracker (e.g. add_task)
     "help": str | None,              # function docstring
     "args": list[ArgSpec],           # argument definitions (positional or flags)
   }
@@ -36,6 +48,7 @@ Shape:
     "help": str,                     # parameter help text
     "choices": tuple | None,         # Literal choices when provided
     "default": Any | None,           # default value (if any)
+    "action": str,                   # only for bool flags: "store_true" (no "choices")
   }
 """
 
@@ -45,103 +58,72 @@ def add_query(func: Callable) -> Callable:
     name = func.__name__.removesuffix("_task").replace("_", "-")
     queries[name] = {"command": func, "help": func.__doc__, "args": []}
     for p in signature(func).parameters.values():
-        if p.name in ("store"):
+        if p.name == "tracker":
             continue
         t, *metadata = get_args(p.annotation)
         if get_origin(t) is Union:
             t = get_args(t)[0]
-        queries[name]["args"].append(
-            {
-                "name": metadata[1:] if len(metadata) > 1 else [p.name],
-                "help": metadata[0],
-                "choices": get_args(t) if get_origin(t) is Literal else None,
-                "default": p.default if p.default is not p.empty else None,
-            }
-        )
+        arg_spec = {
+            "name": metadata[1:] if len(metadata) > 1 else [p.name],
+            "help": metadata[0],
+            "choices": get_args(t) if get_origin(t) is Literal else None,
+            "default": p.default if p.default is not p.empty else None,
+        }
+        if t is bool:
+            del arg_spec["choices"]
+            arg_spec["action"] = "store_true"
+        queries[name]["args"].append(arg_spec)
     return func
 
 
 @add_query
-def add_task(store: Store, description: Annotated[str, "Description of the task"]) -> bool:
+def add_task(tracker: "TaskTracker", description: Annotated[str, "Description of the task"]) -> None:
     """Add a new task."""
-    id: TASK_ID = str(store["nextId"])
-    now: str = _get_date_time()
-    status: TASK_STATUS_TYPES = "todo"
-    record: TaskRecord = {
-        "description": description,
-        "status": status,
-        "createdAt": now,
-        "updatedAt": now,
-    }
-    store["tasks"][id] = record
-    store["order"].append(id)
-    store["nextId"] += 1
-
-    list_task(store, task_id=id)
-    return True
+    print(render_tasks([tracker.add(description)]))
 
 
 @add_query
 def update_task(
-    store: Store,
+    tracker: "TaskTracker",
     task_id: Annotated[str, "ID of the task to update"],
     description: Annotated[Optional[str], "Updated task description", "--description", "-d"] = None,
     status: Annotated[Optional[TASK_STATUS_TYPES], "Updated task status", "--status", "-s"] = None,
-) -> bool:
+) -> None:
     """Update a task's description and/or status."""
-    if task_id not in store["tasks"]:
-        raise KeyError(f"Task with ID {task_id} does not exist.")
-
-    record = store["tasks"][task_id]
-    if description is not None:
-        record["description"] = description
-    if status is not None:
-        if status not in VALID_STATUSES:
-            raise ValueError(f"Invalid status '{status}'. Valid statuses: {', '.join(VALID_STATUSES)}")
-        record["status"] = status
-    record["updatedAt"] = _get_date_time()
-
-    list_task(store, task_id=task_id)
-    return True
+    print(render_tasks([tracker.update(task_id, description, status)]))
 
 
 @add_query
 def delete_task(
-    store: Store,
+    tracker: "TaskTracker",
     task_id: Annotated[str, "ID of the task to delete"],
-) -> bool:
+) -> None:
     """Delete a task."""
-    if task_id not in store["tasks"]:
-        raise KeyError(f"Task with ID {task_id} does not exist.")
-    if task_id in store["order"]:
-        store["order"].remove(task_id)
-    del store["tasks"][task_id]
-
+    tracker.delete(task_id)
     print("Task deleted successfully")
-    return True
 
 
 @add_query
 def mark_in_progress(
-    store: Store,
+    tracker: "TaskTracker",
     task_id: Annotated[str, "ID of the task to mark 'in-progress'"],
-) -> bool:
+) -> None:
     """Set task status to 'in-progress'."""
-    return update_task(store, task_id, status="in-progress")
+    print(render_tasks([tracker.mark_in_progress(task_id)]))
 
 
 @add_query
 def mark_done(
-    store: Store,
+    tracker: "TaskTracker",
     task_id: Annotated[str, "ID of the task to mark 'done'"],
-) -> bool:
+) -> None:
     """Set task status to 'done'."""
-    return update_task(store, task_id, status="done")
+    print(render_tasks([tracker.mark_done(task_id)]))
 
 
 @add_query
 def list_task(
-    store: Store,
+    tracker: "TaskTracker",
     task_id: Annotated[
         Optional[str],
         "List a specific task by ID.",
@@ -161,10 +143,117 @@ def list_task(
         "--date",
         "-d",
     ] = None,
-) -> bool:
+    as_of: Annotated[
+        Optional[str],
+        "List tasks as they were at a point in time (YYYY-MM-DD or ISO datetime), from the store's history.",
+        "--as-of",
+    ] = None,
+    watch: Annotated[
+        bool,
+        "Keep running and redraw the list whenever the store changes (Ctrl-C to stop). "
+        "A missing --task-id is reported in place of the table until the task exists.",
+        "--watch",
+        "-w",
+    ] = False,
+) -> None:
     """List tasks filtered by status and/or date."""
-    if status not in {*VALID_STATUSES, "all"}:
-        raise ValueError(f"Invalid status '{status}'. Valid statuses: {', '.join(VALID_STATUSES)}.")
+    if watch:
+        if as_of is not None:
+            raise ValueError("--watch cannot be combined with --as-of")
+        # watch_store() polls and loads the file itself; the (lazy) tracker never loads it
+        watch_store(tracker.path, _watch_renderer(task_id, status, date))
+    elif as_of is not None:
+        # Reads the history file, which the query cache doesn't track
+        print(render_tasks(tracker.list(task_id, status, date, as_of)))
+    else:
+        print(_list_with_cache(tracker, task_id, status, date))
+
+
+@add_query
+def history_task(
+    tracker: "TaskTracker",
+    task_id: Annotated[str, "ID of the task to show the history of"],
+) -> None:
+    """Show the change history of a task."""
+    rows = [
+        {
+            "At": _format_timestamp(change["at"]),
+            "Change": change["change"],
+            "Description": change["fields"].get("description", ""),
+            "Status": change["fields"].get("status", ""),
+        }
+        for change in tracker.history(task_id)
+    ]
+    print(tabulate(rows, tablefmt=TABLE_FORMAT, headers="keys"))
+
+
+@add_query
+def stats_task(tracker: "TaskTracker") -> None:
+    """Show task counts by status."""
+    print(tabulate([tracker.stats()], tablefmt=TABLE_FORMAT, headers="keys"))
+
+
+def create_task(store: Store, description: str) -> Task:
+    """Add a new 'todo' task to the store and return it."""
+    id: TASK_ID = str(store["nextId"])
+    now: str = _get_date_time()
+    status: TASK_STATUS_TYPES = "todo"
+    record: TaskRecord = {
+        "description": description,
+        "status": status,
+        "createdAt": now,
+        "updatedAt": now,
+    }
+    store["tasks"][id] = record
+    store["order"].append(id)
+    store["nextId"] += 1
+    return to_task(id, record)
+
+
+def edit_task(
+    store: Store,
+    task_id: TASK_ID,
+    description: Optional[str] = None,
+    status: Optional[TASK_STATUS_TYPES] = None,
+) -> Task:
+    """Update a task's description and/or status in the store and return it."""
+    if task_id not in store["tasks"]:
+        raise KeyError(f"Task with ID {task_id} does not exist.")
+    if status is not None and status not in VALID_STATUSES:
+        raise ValueError(f"Invalid status '{status}'. Valid statuses: {', '.join(VALID_STATUSES)}")
+
+    record = store["tasks"][task_id]
+    if description is not None:
+        record["description"] = description
+    if status is not None:
+        record["status"] = status
+    record["updatedAt"] = _get_date_time()
+    return to_task(task_id, record)
+
+
+def remove_task(store: Store, task_id: TASK_ID) -> Task:
+    """Delete a task from the store and return it."""
+    if task_id not in store["tasks"]:
+        raise KeyError(f"Task with ID {task_id} does not exist.")
+    if task_id in store["order"]:
+        store["order"].remove(task_id)
+    return to_task(task_id, store["tasks"].pop(task_id))
+
+
+def to_task(task_id: TASK_ID, record: TaskRecord) -> Task:
+    """Copy a stored record into a standalone Task that includes its ID."""
+    task: Task = {"id": task_id, **record}
+    return task
+
+
+def select_tasks(
+    store: Store,
+    task_id: Optional[str] = None,
+    status: TASK_STATUS_FILTER = "all",
+    date: Optional[str] = None,
+) -> list[tuple[TASK_ID, TaskRecord]]:
+    """Return the (id, record) pairs matching the list_task() filters, in store order."""
+    _validate_status_filter(status)
     filter_date = get_date_filter(date)
     store_tasks = store["tasks"]
     if task_id is not None:
@@ -173,14 +262,159 @@ def list_task(
         task_ids = [task_id]
     else:
         task_ids = store["order"]
+    return [(id, store_tasks[id]) for id in task_ids if _task_matches(store_tasks[id], status, filter_date)]
+
+
+def render_tasks(tasks: list[Task]) -> str:
+    """Render tasks as the table printed by list_task()."""
+    return _render_rows([_task_to_row(task["id"], task) for task in tasks])
+
+
+def count_tasks(store: Store) -> dict[str, int]:
+    """Count tasks per status, plus a 'Total' column."""
+    counts = dict.fromkeys(("todo", "in-progress", "done"), 0)
+    for task in store["tasks"].values():
+        counts[task["status"]] += 1
+    counts["Total"] = len(store["tasks"])
+    return counts
+
+
+def list_stores(
+    store_paths: list[Path],
+    task_id: Optional[str] = None,
+    status: TASK_STATUS_FILTER = "all",
+    date: Optional[str] = None,
+) -> bool:
+    """
+    list_task() across several stores, merged by store then task ID.
+
+    Returns False if any store failed; its error is reported and the rest still print.
+    """
+    _validate_status_filter(status)
+    get_date_filter(date)  # Fail once up front rather than once per store
+    results = scan_stores(store_paths, select_tasks, task_id=task_id, status=status, date=date)
     rows: list[dict[str, str]] = []
-    for id in task_ids:
-        task = store_tasks[id]
-        if (status == "all" or task["status"] == status) and filter_date(task["createdAt"]):
-            rows.append(_task_to_row(id, task))
+    for path, matches in results:
+        if isinstance(matches, list):
+            for id, task in sorted(matches, key=lambda match: int(match[0])):
+                rows.append({"Store": str(path), **_task_to_row(id, task)})
+
+    print(tabulate(rows, tablefmt=TABLE_FORMAT, headers="keys") or "No Tasks Yet!")
+    return _report_store_errors(results)
+
+
+def stats_stores(store_paths: list[Path]) -> bool:
+    """stats_task() across several stores, with a grand total row."""
+    results = scan_stores(store_paths, count_tasks)
+    rows: list[dict] = []
+    totals: dict[str, int] = {}
+    for path, counts in results:
+        if isinstance(counts, dict):
+            rows.append({"Store": str(path), **counts})
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+    if totals:
+        rows.append({"Store": "Total", **totals})
+
+    print(tabulate(rows, tablefmt=TABLE_FORMAT, headers="keys") or "No Tasks Yet!")
+    return _report_store_errors(results)
+
+
+# Queries that can run against several stores at once via --stores
+multi_store_queries: dict[str, Callable[..., bool]] = {"list": list_stores, "stats": stats_stores}
+
+
+def scan_stores(store_paths: list[Path], func: Callable, **kwargs) -> list[tuple[Path, Any]]:
+    """
+    Load each store and apply func(store, **kwargs) to it in a process pool.
 
-    print(tabulate(rows, tablefmt="rounded_grid", headers="keys") or "No Tasks Yet!")
-    return False
+    func must be a picklable module-level function. Results come back sorted by path;
+    a store that fails to load or query yields its StoreError/KeyError/ValueError
+    instead of a result, so one bad store never hides the others.
+    """
+    paths = sorted(store_paths)
+    if len(paths) <= 1:
+        return [(path, _scan_store(path, func, kwargs)) for path in paths]
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_scan_store, path, func, kwargs) for path in paths]
+        return [(path, future.result()) for path, future in zip(paths, futures)]
+
+
+def _scan_store(path: Path, func: Callable, kwargs: dict) -> Any:
+    try:
+        return func(read_store(path), **kwargs)
+    except (StoreError, KeyError, ValueError) as e:
+        return e
+
+
+def _report_store_errors(results: list[tuple[Path, Any]]) -> bool:
+    ok = True
+    for path, result in results:
+        if isinstance(result, Exception):
+            print(f"Error: {path}: {result}", file=sys.stderr)
+            ok = False
+    return ok
+
+
+def _list_with_cache(
+    tracker: "TaskTracker",
+    task_id: Optional[str],
+    status: TASK_STATUS_FILTER,
+    date: Optional[str],
+) -> str:
+    """Render list_task() output, served from the store's query cache when the store is unchanged."""
+    date = (date or "").strip() or None
+    key = cache_key(task_id=task_id, status=status, date=date, format=TABLE_FORMAT)
+    stamp = store_stamp(tracker.path)  # Before loading; see store_stamp()
+    output = get_cached(tracker.path, key, stamp)
+    if output is None:
+        output = render_tasks(tracker.list(task_id, status, date))
+        put_cached(tracker.path, key, stamp, output)
+    return output
+
+
+def _watch_renderer(
+    task_id: Optional[str],
+    status: TASK_STATUS_FILTER,
+    date: Optional[str],
+) -> Callable[[Store, set[TASK_ID]], str]:
+    """
+    Build a watch_store() renderer for list_task()'s filters.
+
+    Keeps each task's formatted row between redraws; only tasks whose records changed
+    are re-filtered and re-formatted.
+    """
+    _validate_status_filter(status)
+    filter_date = get_date_filter(date)
+    rows: dict[TASK_ID, dict[str, str]] = {}
+
+    def render(store: Store, changed: set[TASK_ID]) -> str:
+        for id in changed:
+            task = store["tasks"].get(id)
+            if task is not None and (task_id is None or id == task_id) and _task_matches(task, status, filter_date):
+                rows[id] = _task_to_row(id, task)
+            else:
+                rows.pop(id, None)
+        if task_id is not None and task_id not in store["tasks"]:
+            # Same message as a plain `list --task-id`
+            return f"Task with ID {task_id} does not exist."
+        return _render_rows([rows[id] for id in store["order"] if id in rows])
+
+    return render
+
+
+def _task_matches(task: TaskRecord, status: TASK_STATUS_FILTER, filter_date: Callable[[str], bool]) -> bool:
+    return (status == "all" or task["status"] == status) and filter_date(task["createdAt"])
+
+
+def _render_rows(rows: list[dict[str, str]]) -> str:
+    return tabulate(rows, tablefmt=TABLE_FORMAT, headers="keys") or "No Tasks Yet!"
+
+
+def _validate_status_filter(status: str) -> None:
+    if status not in {*VALID_STATUSES, "all"}:
+        raise ValueError(f"Invalid status '{status}'. Valid statuses: {', '.join(VALID_STATUSES)}.")
 
 
 def _format_timestamp(iso_timestamp: str) -> str:
@@ -0,0 +1,256 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional
+
+from models import TASK_ID, Store, TaskChange
+from store import DEFAULT_PATH, StoreError, read_generation
+
+CHECKPOINT_INTERVAL = 100  # Saves between full store snapshots in the history file
+
+
+class HistoryWarning(UserWarning):
+    """Issued when a change was saved to the store but couldn't be appended to its history."""
+
+
+def history_path(store_path: Path) -> Path:
+    """Append-only sidecar holding the store's change log (e.g. tasks.json.history)."""
+    return store_path.with_name(store_path.name + ".history")
+
+
+def snapshot_store(store: Store) -> Store:
+    """Copy a store deeply enough that later in-place command edits don't affect it."""
+    return {
+        "nextId": store["nextId"],
+        "order": list(store["order"]),
+        "tasks": {id: dict(record) for id, record in store["tasks"].items()},
+    }
+
+
+def record_history(store_path: Path, before: Store, after: Store) -> None:
+    """
+    Append the per-task deltas between two versions of a store to its history file.
+
+    Each line is one JSON entry, either a delta or a full checkpoint:
+      {"at": ..., "op": "add",    "id": "3", "set": {<full record>}}
+      {"at": ..., "op": "update", "id": "3", "set": {<changed fields only>}}
+      {"at": ..., "op": "delete", "id": "3"}
+      {"at": ..., "checkpoint": {<store>}}
+
+    The cost depends on the store size, never on how long the history is. A checkpoint
+    of `before` starts a new history file, and one of `after` is added every
+    CHECKPOINT_INTERVAL saves so time-travel queries only replay a bounded tail.
+    Call after save_tasks() so the generation counter reflects this save.
+    """
+    now = _now()
+    entries: list[dict[str, Any]] = []
+    path = history_path(store_path)
+    new_file = not path.exists()
+    if new_file:
+        entries.append({"at": now, "checkpoint": before})
+
+    old_tasks, new_tasks = before["tasks"], after["tasks"]
+    for id in after["order"]:
+        record = new_tasks[id]
+        if id not in old_tasks:
+            entries.append({"at": now, "op": "add", "id": id, "set": dict(record)})
+        elif record != old_tasks[id]:
+            changes = {key: value for key, value in record.items() if old_tasks[id].get(key) != value}
+            entries.append({"at": now, "op": "update", "id": id, "set": changes})
+    for id in before["order"]:
+        if id not in new_tasks:
+            entries.append({"at": now, "op": "delete", "id": id})
+
+    if read_generation(store_path) % CHECKPOINT_INTERVAL == 0:
+        entries.append({"at": now, "checkpoint": snapshot_store(after)})
+
+    index: list[dict[str, Any]] = []
+    try:
+        with path.open("ab") as file:
+            for entry in entries:
+                if "checkpoint" in entry:
+                    index.append({"at": entry["at"], "offset": file.tell()})
+                file.write((json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8"))
+        if index:
+            # A new history file invalidates every offset indexed for the old one
+            with checkpoint_index_path(store_path).open("w" if new_file else "a", encoding="utf-8") as file:
+                file.writelines(json.dumps(item) + "\n" for item in index)
+    except OSError:
+        raise StoreError(f"unable to write history file at {path}.", exit_code=2)
+
+
+def checkpoint_index_path(store_path: Path) -> Path:
+    """Byte offsets of the checkpoints in the history file (e.g. tasks.json.checkpoints)."""
+    return store_path.with_name(store_path.name + ".checkpoints")
+
+
+def read_history(store_path: Path = DEFAULT_PATH) -> Iterator[dict[str, Any]]:
+    """Yield history entries oldest first."""
+    path = history_path(store_path)
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+    except FileNotFoundError:
+        raise ValueError(f"No history recorded for {store_path}.")
+    except (OSError, ValueError):
+        raise StoreError(f"History file is invalid. Fix or delete {path} and try again.")
+
+
+def task_history(store_path: Path, task_id: TASK_ID) -> list[TaskChange]:
+    """Return a task's changes oldest first; 'fields' holds the values each change set."""
+    changes: list[TaskChange] = []
+    for entry in read_history(store_path):
+        if "checkpoint" in entry:
+            record = entry["checkpoint"]["tasks"].get(task_id)
+            if record is not None and not changes:
+                # Task predates the history file; start from its first snapshot
+                changes.append({"at": entry["at"], "change": "snapshot", "fields": dict(record)})
+        elif entry["id"] == task_id:
+            changes.append({"at": entry["at"], "change": entry["op"], "fields": entry.get("set", {})})
+    if not changes:
+        raise KeyError(f"Task with ID {task_id} has no history.")
+    return changes
+
+
+def store_as_of(store_path: Path, as_of: str) -> Store:
+    """
+    Rebuild the store as it was at a point in time.
+
+    as_of is a date (YYYY-MM-DD, meaning the end of that day) or an ISO datetime
+    (UTC unless it has an offset). Seeks to the latest checkpoint at or before then using
+    the checkpoint index, and only decodes that checkpoint and the deltas after it. An
+    index that doesn't match the file (e.g. after the history was edited) falls back to
+    a scan from the start.
+    """
+    cutoff = _parse_as_of(as_of)
+    path = history_path(store_path)
+    offset = _checkpoint_offset(store_path, cutoff)
+    try:
+        checkpoint, delta_lines, first_at = _scan_history(path, cutoff, offset)
+        if offset and checkpoint is None:
+            # Stale index: scan from the start
+            checkpoint, delta_lines, first_at = _scan_history(path, cutoff, 0)
+        if checkpoint is None:
+            raise ValueError(f"No history recorded before {first_at}.")
+        store = snapshot_store(checkpoint)
+        for line in delta_lines:
+            _apply_delta(store, json.loads(line))
+    except FileNotFoundError:
+        raise ValueError(f"No history recorded for {store_path}.")
+    except (OSError, KeyError, TypeError, UnicodeDecodeError, json.JSONDecodeError):
+        raise StoreError(f"History file is invalid. Fix or delete {path} and try again.")
+    return store
+
+
+def _checkpoint_offset(store_path: Path, cutoff: str) -> int:
+    """Byte offset of the latest indexed checkpoint at or before cutoff (0 if none)."""
+    offset = 0
+    try:
+        with checkpoint_index_path(store_path).open("r", encoding="utf-8") as file:
+            for line in file:
+                item = json.loads(line)
+                if item["at"] > cutoff:
+                    break
+                offset = item["offset"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # The index is only an optimization
+    return offset if isinstance(offset, int) else 0
+
+
+def _scan_history(path: Path, cutoff: str, offset: int) -> tuple[Optional[Store], list[str], Optional[str]]:
+    """
+    Find the last checkpoint at or before cutoff from offset on, and the delta lines after it.
+
+    Only that checkpoint is JSON-decoded; other lines just have their leading timestamp read.
+    A non-zero offset must be the start of a checkpoint line at or before cutoff; otherwise
+    the index is stale and no checkpoint is returned.
+    Returns (checkpoint, delta_lines, first_timestamp_seen).
+    """
+    checkpoint: Optional[Store] = None
+    checkpoint_line: Optional[str] = None
+    delta_lines: list[str] = []
+    first_at: Optional[str] = None
+    with path.open("rb") as file:
+        if offset:
+            checkpoint = _checkpoint_at(file, offset, cutoff)
+            if checkpoint is None:
+                return None, [], None
+        for raw in file:
+            line = raw.decode("utf-8")
+            if not line.strip():
+                continue
+            at, is_checkpoint = _peek_entry(line)
+            first_at = first_at or at
+            if at > cutoff:
+                break  # Entries are appended in time order
+            if is_checkpoint:
+                checkpoint_line, delta_lines = line, []
+            else:
+                delta_lines.append(line)
+    if checkpoint_line is not None:
+        checkpoint = json.loads(checkpoint_line)["checkpoint"]
+    return checkpoint, delta_lines, first_at
+
+
+def _checkpoint_at(file: BinaryIO, offset: int, cutoff: str) -> Optional[Store]:
+    """Decode the checkpoint whose line starts at offset, leaving file positioned after it."""
+    file.seek(offset - 1)
+    if file.read(1) != b"\n":
+        return None  # Not the start of a line
+    try:
+        entry = json.loads(file.readline())
+        if entry["at"] <= cutoff:
+            return entry["checkpoint"]
+    except (ValueError, KeyError, TypeError):
+        pass  # Covers UnicodeDecodeError and JSONDecodeError
+    return None
+
+
+def _peek_entry(line: str) -> tuple[str, bool]:
+    """Read (at, is_checkpoint) from a history line without decoding the whole entry."""
+    prefix = '{"at": "'
+    end = line.find('"', len(prefix))
+    if line.startswith(prefix) and end != -1:
+        return line[len(prefix) : end], line.startswith(', "checkpoint": ', end + 1)
+    entry = json.loads(line)
+    return entry["at"], "checkpoint" in entry
+
+
+def _apply_delta(store: Store, delta: dict[str, Any]) -> None:
+    """
+    Replay one delta. Concurrent CLI writers can log conflicting deltas (e.g. an update
+    to a task another process deleted), so deltas for unknown tasks are skipped and a
+    repeated add overwrites the task rather than duplicating it.
+    """
+    id: TASK_ID = delta["id"]
+    tasks = store["tasks"]
+    if delta["op"] == "add":
+        if id not in tasks:
+            store["order"].append(id)
+        tasks[id] = dict(delta["set"])
+        store["nextId"] = max(store["nextId"], int(id) + 1)
+    elif delta["op"] == "update" and id in tasks:
+        tasks[id].update(delta["set"])
+    elif delta["op"] == "delete" and id in tasks:
+        store["order"].remove(id)
+        del tasks[id]
+
+
+def _parse_as_of(as_of: str) -> str:
+    """Normalize as_of into the UTC ISO format used for history timestamps."""
+    try:
+        if len(as_of.strip()) == len("YYYY-MM-DD"):
+            moment = datetime.strptime(as_of.strip(), "%Y-%m-%d") + timedelta(days=1, seconds=-1)
+        else:
+            moment = datetime.fromisoformat(as_of.strip())
+    except ValueError:
+        raise ValueError(f"Invalid --as-of value: {as_of!r}. Expected YYYY-MM-DD or an ISO datetime.")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -0,0 +1,268 @@
+"""
+Load-test harness: many processes driving tasker through main.main() against one store.
+
+    python loadtest.py --processes 8 --ops 200 --seed-tasks 1000 --json results.json
+
+Each worker process runs a weighted mix of add/update/mark-done/delete/list commands, and
+the report gives latency percentiles, throughput, lost updates and store file growth.
+Lost updates are counted from the task IDs that successful adds printed and the IDs that
+successful deletes removed: an ID issued twice, or missing from the final store without a
+recorded delete, is an add overwritten by a concurrent save, and a deleted ID still in the
+store is a lost delete. Lost updates to descriptions and statuses are not detected. The
+final store is also checked against the invariants enforced by store._parse_store
+(nextId, order == tasks).
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from argparse import ArgumentParser
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+import main
+from history import history_path
+from models import TASK_ID, Store
+from store import StoreError, _parse_store, write_store
+
+DEFAULT_MIX = {"add": 20, "update": 20, "mark-done": 10, "delete": 5, "list": 45}
+TASK_ROW_ID = re.compile(r"^│\s*(\d+)\s*│", re.MULTILINE)  # ID cell of a printed task row
+
+
+def run_load_test(
+    store_path: Path,
+    processes: int = 4,
+    ops: int = 100,
+    seed_tasks: int = 100,
+    mix: Optional[dict[str, int]] = None,
+    sample_interval: float = 0.25,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Seed a store, hammer it from `processes` workers running `ops` commands each, and report."""
+    mix = mix or DEFAULT_MIX
+    _seed_store(store_path, seed_tasks)
+    samples: list[dict[str, float]] = []
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample_sizes, args=(store_path, samples, sample_interval, stop), daemon=True)
+
+    started = time.perf_counter()
+    sampler.start()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(_worker, store_path, worker, ops, seed_tasks, mix, seed + worker) for worker in range(processes)
+        ]
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - started
+    stop.set()
+    sampler.join()
+    samples.append(_size_sample(store_path, elapsed))
+
+    latencies: dict[str, list[float]] = {op: [] for op in mix}
+    errors = dict.fromkeys(mix, 0)
+    added: list[TASK_ID] = []
+    deleted: list[TASK_ID] = []
+    for result in results:
+        for op, latency, ok in result["calls"]:
+            latencies[op].append(latency)
+            errors[op] += not ok
+        added.extend(result["added"])
+        deleted.extend(result["deleted"])
+
+    all_latencies = [latency for values in latencies.values() for latency in values]
+    return {
+        "config": {"processes": processes, "ops": ops, "seed_tasks": seed_tasks, "mix": mix, "seed": seed},
+        "elapsed_s": round(elapsed, 3),
+        "throughput_ops_s": round(len(all_latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "all": _summarize(all_latencies),
+            **{op: _summarize(values) for op, values in latencies.items()},
+        },
+        "errors": errors,
+        "integrity": _check_store(store_path, seed_tasks, added, deleted),
+        "file_size": samples,
+    }
+
+
+def _seed_store(store_path: Path, seed_tasks: int) -> None:
+    now = "2026-01-01T00:00:00+00:00"
+    ids = [str(i) for i in range(1, seed_tasks + 1)]
+    store: Store = {
+        "nextId": seed_tasks + 1,
+        "order": ids,
+        "tasks": {
+            id: {"description": f"seed-{id}", "status": "todo", "createdAt": now, "updatedAt": now} for id in ids
+        },
+    }
+    write_store(store, store_path)
+
+
+def _worker(
+    store_path: Path,
+    worker: int,
+    ops: int,
+    seed_tasks: int,
+    mix: dict[str, int],
+    seed: int,
+) -> dict[str, Any]:
+    """Run `ops` random commands in this process and time each main.main() call."""
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    calls: list[tuple[str, float, bool]] = []
+    added: list[TASK_ID] = []
+    deleted: list[TASK_ID] = []
+    for i in range(ops):
+        op = rng.choices(names, weights)[0]
+        # IDs beyond the seed exist once workers have added tasks; misses count as errors
+        task_id = str(rng.randint(1, seed_tasks + len(added) + 1))
+        description = f"load-{worker}-{i}"
+        if op == "add":
+            args = ["add", description]
+        elif op == "update":
+            args = ["update", task_id, "--description", description]
+        elif op == "list":
+            args = ["list", "--status", rng.choice(["all", "todo", "in-progress", "done"])]
+        else:
+            args = [op, task_id]
+
+        latency, ok, output = _run_cli(store_path, args)
+        calls.append((op, latency, ok))
+        if ok and op == "add":
+            added.append(TASK_ROW_ID.findall(output)[0])
+        elif ok and op == "delete":
+            deleted.append(task_id)
+    return {"calls": calls, "added": added, "deleted": deleted}
+
+
+def _run_cli(store_path: Path, args: list[str]) -> tuple[float, bool, str]:
+    """Run one tasker command in-process, returning (latency in ms, succeeded, stdout)."""
+    sys.argv = ["tasker", "--store", str(store_path), *args]
+    ok = True
+    out = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            main.main()
+        except SystemExit as e:
+            ok = e.code in (None, 0)
+    return (time.perf_counter() - started) * 1000, ok, out.getvalue()
+
+
+def _check_store(store_path: Path, seed_tasks: int, added: list[TASK_ID], deleted: list[TASK_ID]) -> dict[str, Any]:
+    """Count updates lost to concurrent saves and validate the final store."""
+    try:
+        data: Any = json.loads(store_path.read_text(encoding="utf-8"))
+        store = _parse_store(data, path=store_path)
+    except (OSError, ValueError, StoreError) as e:
+        return {"invariants_ok": False, "error": str(e)}
+
+    deleted_ids = set(deleted)
+    # An ID issued by n adds lost n - 1 of them to stale nextId reads, and all n if it is
+    # gone from the store without any worker having deleted it
+    lost_adds = sum(
+        count - 1 + (id not in store["tasks"] and id not in deleted_ids) for id, count in Counter(added).items()
+    )
+    return {
+        "invariants_ok": True,
+        "next_id": store["nextId"],
+        "expected_next_id": seed_tasks + len(added) + 1,
+        "tasks": len(store["order"]),
+        "lost_adds": lost_adds,
+        # Includes deleted IDs reissued after a lost nextId bump, which is a lost update too
+        "lost_deletes": sum(id in store["tasks"] for id in deleted),
+    }
+
+
+def _sample_sizes(store_path: Path, samples: list[dict[str, float]], interval: float, stop: threading.Event) -> None:
+    started = time.perf_counter()
+    while not stop.wait(interval if samples else 0):
+        samples.append(_size_sample(store_path, time.perf_counter() - started))
+
+
+def _size_sample(store_path: Path, elapsed: float) -> dict[str, float]:
+    def size(path: Path) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    return {"t_s": round(elapsed, 3), "store_bytes": size(store_path), "history_bytes": size(history_path(store_path))}
+
+
+def _summarize(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {"count": 0}
+    values = sorted(latencies)
+
+    def percentile(pct: float) -> float:
+        # Nearest-rank percentile
+        return round(values[max(0, math.ceil(pct / 100 * len(values)) - 1)], 3)
+
+    return {"count": len(values), "p50": percentile(50), "p95": percentile(95), "p99": percentile(99)}
+
+
+def _parse_mix(text: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for part in text.split(","):
+        op, _, weight = part.partition("=")
+        if op.strip() not in DEFAULT_MIX or not weight.strip().isdigit():
+            raise ValueError(f"Invalid mix entry {part!r}. Expected e.g. 'add=20,list=80'.")
+        mix[op.strip()] = int(weight)
+    return mix
+
+
+def cli() -> None:
+    parser = ArgumentParser(description="Run concurrent mixed tasker workloads against one store and report.")
+    parser.add_argument("--store", help="Store to seed and load (default: a temporary file)")
+    parser.add_argument("--processes", type=int, default=4, help="Worker processes (default: 4)")
+    parser.add_argument("--ops", type=int, default=100, help="Commands per worker (default: 100)")
+    parser.add_argument("--seed-tasks", type=int, default=100, help="Tasks in the seeded store (default: 100)")
+    parser.add_argument(
+        "--mix",
+        default=",".join(f"{op}={weight}" for op, weight in DEFAULT_MIX.items()),
+        help="Weighted command mix (default: %(default)s)",
+    )
+    parser.add_argument("--sample-interval", type=float, default=0.25, help="Seconds between file size samples")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for reproducible runs")
+    parser.add_argument("--json", dest="json_path", help="Write the full report as JSON to this path ('-' for stdout)")
+    args = parser.parse_args()
+    try:
+        mix = _parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.store and Path(args.store).expanduser().exists():
+        parser.error(f"'{args.store}' already exists; the load test seeds (and overwrites) its store")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store_path = Path(args.store).expanduser().resolve() if args.store else Path(tmp_dir) / "tasks.json"
+        report = run_load_test(
+            store_path, args.processes, args.ops, args.seed_tasks, mix, args.sample_interval, args.seed
+        )
+
+    if args.json_path == "-":
+        print(json.dumps(report, indent=2))
+        return
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    print(f"{report['latency_ms']['all']['count']} ops in {report['elapsed_s']}s ({report['throughput_ops_s']} ops/s)")
+    for op, stats in report["latency_ms"].items():
+        if stats["count"]:
+            print(f"  {op:<10} n={stats['count']:<6} p50={stats['p50']}ms p95={stats['p95']}ms p99={stats['p99']}ms")
+    print(f"Errors: {report['errors']}")
+    print(f"Integrity: {report['integrity']}")
+    final = report["file_size"][-1]
+    print(f"Final size: store {final['store_bytes']} B, history {final['history_bytes']} B")
+
+
+if __name__ == "__main__":
+    cli()
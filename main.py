@@ -1,31 +1,42 @@
 import sys
+import warnings
 from argparse import ArgumentParser
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional, Union
 
-from commands import queries
-from models import Store
-from store import load_tasks, save_tasks
+from api import TaskTracker
+from commands import multi_store_queries, queries
+from history import HistoryWarning
+from store import StoreError, find_stores
 
 
-def parse_cli() -> tuple[Callable, dict, Path]:
+def parse_cli() -> tuple[Callable, dict, Union[Path, list[Path]]]:
     """
-    Parse CLI arguments into the query function, its kwargs, and the store path.
+    Parse CLI arguments into the query function, its kwargs, and the store path(s).
 
     Builds subcommands from task_ops.queries, parses args with argparse, and
     returns (query, args, store_path) where:
       - query is the callable for the chosen command
       - args is a dict of parsed arguments (excluding command and store)
-      - store_path is an absolute Path to the JSON store (must not be a directory)
+      - store_path is an absolute Path to the JSON store (must not be a directory),
+        or, with --stores, the list of store files matched by the glob; query is
+        then the matching entry from commands.multi_store_queries
     """
     parser: ArgumentParser = ArgumentParser(
         description="This is a CLI task manager made so you can track your everyday tasks."
     )
-    parser.add_argument(
+    store_group = parser.add_mutually_exclusive_group()
+    store_group.add_argument(
         "--store",
         help="Path to your task store (default: 'tasks.json')",
         default="tasks.json",
     )
+    store_group.add_argument(
+        "--stores",
+        help="Glob of task stores to query in parallel, e.g. 'teams/*.json' ("
+        + ", ".join(multi_store_queries)
+        + " only)",
+    )
     subparsers = parser.add_subparsers(title="commands", dest="command", required=True)
     for name, props in queries.items():
         p = subparsers.add_parser(name, help=props["help"])
@@ -35,7 +46,22 @@ def parse_cli() -> tuple[Callable, dict, Path]:
             arg["name"] = name
 
     args: dict = vars(parser.parse_args())
-    query: Callable = queries[args.pop("command")]["command"]
+    command: str = args.pop("command")
+    store_glob: Optional[str] = args.pop("stores")
+    if store_glob is not None:
+        args.pop("store")
+        if command not in multi_store_queries:
+            parser.error(f"--stores only supports: {', '.join(multi_store_queries)}")
+        if args.pop("as_of", None) is not None:
+            parser.error("--as-of cannot be combined with --stores")
+        if args.pop("watch", False):
+            parser.error("--watch cannot be combined with --stores")
+        store_paths = find_stores(store_glob)
+        if not store_paths:
+            parser.error(f"No task stores match '{store_glob}'")
+        return multi_store_queries[command], args, store_paths
+
+    query: Callable = queries[command]["command"]
     store_path: Path = Path(args.pop("store")).expanduser().resolve()
     if store_path.is_dir():
         parser.error(f"Task Store path '{store_path}' is a directory")
@@ -45,13 +71,26 @@ def parse_cli() -> tuple[Callable, dict, Path]:
 
 def main() -> None:
     query, args, store_path = parse_cli()
-    store: Store = load_tasks(store_path)
-    try:
-        should_save = query(store, **args) is not False
-    except Exception as e:
-        sys.exit(str(e))
-    if should_save:
-        save_tasks(store, store_path)  # Save only on mutation
+    if isinstance(store_path, list):
+        try:
+            ok = query(store_path, **args)
+        except Exception as e:
+            sys.exit(str(e))
+        if not ok:
+            sys.exit(1)
+        return
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", HistoryWarning)
+        try:
+            query(TaskTracker(store_path), **args)
+        except StoreError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(e.exit_code)
+        except Exception as e:
+            sys.exit(str(e))
+    # After the command's own output; the change itself was saved, so the exit status is 0
+    for warning in caught:
+        print(f"Warning: {warning.message}", file=sys.stderr)
 
 
 if __name__ == "__main__":
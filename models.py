@@ -15,3 +15,13 @@ class Store(TypedDict):
     nextId: int
     order: list[TASK_ID]
     tasks: dict[TASK_ID, TaskRecord]
+
+
+class Task(TaskRecord):
+    id: TASK_ID
+
+
+class TaskChange(TypedDict):
+    at: str
+    change: Literal["snapshot", "add", "update", "delete"]
+    fields: dict[str, str]
@@ -1,40 +1,68 @@
+import glob
 import json
 import sys
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn, Optional
 
 from models import Store, TaskRecord
 
 DEFAULT_PATH = Path("tasks.json")
 VALID_STATUSES = ("done", "in-progress", "todo")
+# Files kept next to a store (e.g. tasks.json.gen, tasks.json.cache, tasks.json.history)
+SIDECAR_SUFFIXES = (".gen", ".cache", ".history", ".checkpoints")
+
+
+class StoreError(Exception):
+    """Raised when the task store cannot be read, validated, or written."""
+
+    def __init__(self, message: str, exit_code: int = 1) -> None:
+        super().__init__(message)
+        self.exit_code = exit_code
 
 
 def load_tasks(path: Path = DEFAULT_PATH) -> Store:
     """Load the task store from JSON, creating a new store if missing."""
+    try:
+        return read_store(path)
+    except StoreError as e:
+        _exit_with(e)
+
+
+def save_tasks(store: Store, path: Path = DEFAULT_PATH) -> None:
+    """Atomically write the im-memory task store to JSON."""
+    try:
+        write_store(store, path)
+    except StoreError as e:
+        _exit_with(e)
+
+
+def read_store(path: Path = DEFAULT_PATH, previous: Optional[Store] = None) -> Store:
+    """
+    Like load_tasks(), but raises StoreError instead of exiting.
+
+    When reloading, pass the previously loaded store: records that are unchanged
+    since then are reused as-is instead of being validated again.
+    """
     if not path.exists():
         store: Store = {"nextId": 1, "order": [], "tasks": {}}
-        save_tasks(store, path)
+        write_store(store, path)
         return store
 
     try:
         with path.open("r", encoding="utf-8") as file:
             data: Any = json.load(file)
     except json.JSONDecodeError:
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
     except OSError:
-        print(f"Error: unable to read tasks file at {path}.", file=sys.stderr)
-        sys.exit(2)
-
-    if not isinstance(data, dict):
-        _invalid_json_error(path)
+        raise StoreError(f"unable to read tasks file at {path}.", exit_code=2)
 
-    store: Store = _parse_store(data, path=path)
+    store: Store = _parse_store(data, path=path, previous=previous)
     return store
 
 
-def save_tasks(store: Store, path: Path = DEFAULT_PATH) -> None:
-    """Atomically write the im-memory task store to JSON."""
+def write_store(store: Store, path: Path = DEFAULT_PATH) -> None:
+    """Like save_tasks(), but raises StoreError instead of exiting."""
     directory = path.parent
     try:
         with tempfile.NamedTemporaryFile(
@@ -44,23 +72,50 @@ def save_tasks(store: Store, path: Path = DEFAULT_PATH) -> None:
             tmp_file.write("\n")
             temp_name = tmp_file.name
         Path(temp_name).replace(path)
+        write_text_atomic(generation_path(path), f"{read_generation(path) + 1}\n")
     except OSError:
-        print(f"Error: unable to write tasks file at {path}.", file=sys.stderr)
-        sys.exit(2)
+        raise StoreError(f"unable to write tasks file at {path}.", exit_code=2)
+
+
+def find_stores(pattern: str) -> list[Path]:
+    """Expand a glob into the task store files it matches, skipping store sidecar files."""
+    matches = (Path(match) for match in glob.glob(str(Path(pattern).expanduser()), recursive=True))
+    return [path for path in matches if path.is_file() and path.suffix not in SIDECAR_SUFFIXES]
+
+
+def generation_path(path: Path) -> Path:
+    """Sidecar file holding the store's save generation (e.g. tasks.json.gen)."""
+    return path.with_name(path.name + ".gen")
+
+
+def read_generation(path: Path = DEFAULT_PATH) -> int:
+    """Return how many times the store at path has been saved (0 if unknown)."""
+    try:
+        return int(generation_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False, dir=str(path.parent)) as tmp_file:
+        tmp_file.write(text)
+        temp_name = tmp_file.name
+    Path(temp_name).replace(path)
+
+
+def _exit_with(error: StoreError) -> NoReturn:
+    print(f"Error: {error}", file=sys.stderr)
+    sys.exit(error.exit_code)
 
 
-def _invalid_json_error(path: Path) -> None:
-    print(
-        f"Error: Tasks file is invalid JSON. Fix or delete {path} and try again.",
-        file=sys.stderr,
-    )
-    sys.exit(1)
+def _invalid_json_error(path: Path) -> StoreError:
+    return StoreError(f"Tasks file is invalid JSON. Fix or delete {path} and try again.")
 
 
 def _parse_task_record(value: Any, *, path: Path) -> TaskRecord:
     """Validate and normalize a single task record from JSON."""
     if not isinstance(value, dict):
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
 
     description = value.get("description")
     status = value.get("status")
@@ -73,7 +128,7 @@ def _parse_task_record(value: Any, *, path: Path) -> TaskRecord:
         and isinstance(createdAt, str)
         and isinstance(updatedAt, str)
     ):
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
 
     task_record: TaskRecord = {
         "description": description,
@@ -84,9 +139,9 @@ def _parse_task_record(value: Any, *, path: Path) -> TaskRecord:
     return task_record
 
 
-def _parse_store(data: Any, *, path: Path) -> Store:
+def _parse_store(data: Any, *, path: Path, previous: Optional[Store] = None) -> Store:
     if not isinstance(data, dict):
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
 
     next_id = data.get("nextId")
     order = data.get("order")
@@ -100,20 +155,25 @@ def _parse_store(data: Any, *, path: Path) -> Store:
         and all(isinstance(x, str) for x in order)
         and isinstance(tasks, dict)
     ):
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
 
     # Validate tasks
     parsed_tasks: dict[str, TaskRecord] = {}
+    previous_tasks = previous["tasks"] if previous is not None else {}
     for task_id, record in tasks.items():
         if not isinstance(task_id, str) or not task_id.isdigit():
-            _invalid_json_error(path)
-        parsed_tasks[task_id] = _parse_task_record(record, path=path)
+            raise _invalid_json_error(path)
+        old_record = previous_tasks.get(task_id)
+        if old_record is not None and old_record == record:
+            parsed_tasks[task_id] = old_record
+        else:
+            parsed_tasks[task_id] = _parse_task_record(record, path=path)
 
     # Invariants: order should match tasks exactly
     if len(order) != len(set(order)):
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
     if set(order) != set(parsed_tasks.keys()):
-        _invalid_json_error(path)
+        raise _invalid_json_error(path)
 
     # Create Store
     store: Store = {"nextId": next_id, "order": order, "tasks": parsed_tasks}
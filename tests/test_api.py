@@ -0,0 +1,91 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from api import AsyncTaskTracker, TaskTracker
+from history import HistoryWarning
+from store import StoreError, read_generation, read_store, save_tasks
+
+
+# TaskTracker returns typed tasks, persists every change and raises instead of exiting.
+def test_task_tracker(tmp_path: Path, capsys):
+    tracker = TaskTracker(tmp_path / "tasks.json")
+
+    task = tracker.add("Write tests")
+    assert task["id"] == "1"
+    assert task["description"] == "Write tests"
+    assert task["status"] == "todo"
+    tracker.add("Ship it")
+    assert tracker.mark_done("1")["status"] == "done"
+    assert tracker.delete("2")["description"] == "Ship it"
+    assert capsys.readouterr().out == ""
+
+    assert read_store(tracker.path)["order"] == ["1"]
+    assert [t["id"] for t in tracker.list(status="done")] == ["1"]
+    assert tracker.stats() == {"todo": 0, "in-progress": 0, "done": 1, "Total": 1}
+    assert [change["change"] for change in tracker.history("2")] == ["add", "delete"]
+
+    with pytest.raises(KeyError):
+        tracker.update("2", description="Gone")
+    with pytest.raises(ValueError):
+        tracker.update("1", status="blocked")
+    assert tracker.list()[0]["status"] == "done"
+
+    (tmp_path / "bad.json").write_text("{", encoding="utf-8")
+    with pytest.raises(StoreError):
+        TaskTracker(tmp_path / "bad.json").list()
+
+
+# TaskTracker shares its loaded store until the file changes on disk.
+def test_task_tracker_reloads_on_change(tmp_path: Path):
+    tracker = TaskTracker(tmp_path / "tasks.json")
+    tracker.add("Alpha")
+    store = tracker.store
+    assert tracker.store is store
+
+    save_tasks({"nextId": 1, "order": [], "tasks": {}}, tracker.path)
+    assert tracker.store is not store
+    assert tracker.list() == []
+
+
+# A failed history append after a successful save warns and leaves nothing pending to re-log.
+def test_task_tracker_history_failure(tmp_path: Path, monkeypatch):
+    tracker = TaskTracker(tmp_path / "tasks.json")
+    tracker.add("Alpha")
+
+    def fail(*args):
+        raise StoreError("history is read-only")
+
+    monkeypatch.setattr("api.record_history", fail)
+    with pytest.warns(HistoryWarning, match="was saved"):
+        assert tracker.add("Beta")["id"] == "2"
+    monkeypatch.undo()
+
+    assert read_store(tracker.path)["order"] == ["1", "2"]
+    tracker.add("Gamma")
+    assert [change["change"] for change in tracker.history("3")] == ["add"]
+    with pytest.raises(KeyError):
+        tracker.history("2")  # Not re-logged by the next save
+
+    save_tasks({"nextId": 1, "order": [], "tasks": {}}, tracker.path)
+    assert tracker.list() == []
+
+
+# AsyncTaskTracker coalesces concurrent writes into fewer saves.
+def test_async_task_tracker(tmp_path: Path):
+    async def scenario():
+        tracker = AsyncTaskTracker(tmp_path / "tasks.json")
+        await tracker.stats()
+        generation = read_generation(tracker.path)
+
+        tasks = await asyncio.gather(*(tracker.add(f"Task {i}") for i in range(20)))
+
+        assert sorted(int(task["id"]) for task in tasks) == list(range(1, 21))
+        assert read_generation(tracker.path) - generation < 20
+        assert len(read_store(tracker.path)["tasks"]) == 20
+        assert len(await tracker.list()) == 20
+        with pytest.raises(KeyError):
+            await tracker.mark_done("99")
+
+    asyncio.run(scenario())
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import cache
+from cache import cache_key, cache_path, get_cached, put_cached, store_stamp
+from store import save_tasks
+
+
+def _make_store(path: Path) -> None:
+    save_tasks({"nextId": 1, "order": [], "tasks": {}}, path)
+
+
+# get_cached returns output only while the store is unchanged.
+def test_cache_hit_and_invalidation(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    assert store_stamp(path) is None
+    _make_store(path)
+    key = cache_key(status="all", date=None, task_id=None, format="rounded_grid")
+
+    stamp = store_stamp(path)
+    assert get_cached(path, key, stamp) is None
+    put_cached(path, key, stamp, "rendered")
+    assert cache_path(path).exists()
+    assert get_cached(path, key, store_stamp(path)) == "rendered"
+
+    # Saving bumps the generation, even if the file's size and mtime look the same
+    _make_store(path)
+    assert store_stamp(path) != stamp
+    assert get_cached(path, key, store_stamp(path)) is None
+
+
+# put_cached evicts the least recently used entries past the cap.
+def test_cache_lru_eviction(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_MAX_ENTRIES", 2)
+    path = tmp_path / "tasks.json"
+    _make_store(path)
+    stamp = store_stamp(path)
+
+    put_cached(path, "a", stamp, "A")
+    put_cached(path, "b", stamp, "B")
+    assert get_cached(path, "a", stamp) == "A"  # "b" is now least recently used
+    put_cached(path, "c", stamp, "C")
+
+    assert get_cached(path, "b", stamp) is None
+    assert get_cached(path, "a", stamp) == "A"
+    assert get_cached(path, "c", stamp) == "C"
@@ -1,24 +1,40 @@
 import datetime
+import sys
+from pathlib import Path
 
 import pytest
 
+import main
+from api import TaskTracker
 from commands import (
     add_task,
+    count_tasks,
+    create_task,
     delete_task,
+    edit_task,
     get_date_filter,
+    list_stores,
     list_task,
     mark_done,
     mark_in_progress,
     queries,
+    stats_stores,
     update_task,
 )
+from history import history_path
+from store import read_store, save_tasks
+
+
+@pytest.fixture
+def tracker(tmp_path: Path) -> TaskTracker:
+    return TaskTracker(tmp_path / "tasks.json")
 
 
 # add_task stores a new task and increments IDs without breaking order.
-def test_add_task():
-    store = {"nextId": 1, "order": [], "tasks": {}}
+def test_add_task(tracker: TaskTracker):
+    store = tracker.store
 
-    add_task(store, "Write tests")
+    add_task(tracker, "Write tests")
 
     assert store["nextId"] == 2
     assert store["order"] == ["1"]
@@ -29,8 +45,8 @@ def test_add_task():
     assert record_1["createdAt"] == record_1["updatedAt"]
     datetime.datetime.fromisoformat(record_1["createdAt"])
 
-    add_task(store, "Meet up with friends")
-    add_task(store, "Buy groceries")
+    add_task(tracker, "Meet up with friends")
+    add_task(tracker, "Buy groceries")
 
     assert store["nextId"] == 4
     assert len(store["order"]) == 3
@@ -38,15 +54,15 @@ def test_add_task():
 
 
 # update_task changes description/status and refreshes updatedAt.
-def test_update_task():
-    store = {"nextId": 1, "order": [], "tasks": {}}
-    add_task(store, "Original description")
+def test_update_task(tracker: TaskTracker):
+    store = tracker.store
+    add_task(tracker, "Original description")
 
     old_timestamp = "2000-01-01T00:00:00+00:00"
     store["tasks"]["1"]["createdAt"] = old_timestamp
     store["tasks"]["1"]["updatedAt"] = old_timestamp
 
-    update_task(store, "1", description="Updated description")
+    update_task(tracker, "1", description="Updated description")
 
     record = store["tasks"]["1"]
     assert record["description"] == "Updated description"
@@ -55,7 +71,7 @@ def test_update_task():
     assert record["updatedAt"] != old_timestamp
     datetime.datetime.fromisoformat(record["updatedAt"])
 
-    update_task(store, "1", status="done")
+    update_task(tracker, "1", status="done")
 
     record = store["tasks"]["1"]
     assert record["description"] == "Updated description"
@@ -64,12 +80,12 @@ def test_update_task():
 
 
 # delete_task removes the task from both tasks and order.
-def test_delete_task():
-    store = {"nextId": 1, "order": [], "tasks": {}}
-    add_task(store, "First task")
-    add_task(store, "Second task")
+def test_delete_task(tracker: TaskTracker):
+    store = tracker.store
+    add_task(tracker, "First task")
+    add_task(tracker, "Second task")
 
-    delete_task(store, "1")
+    delete_task(tracker, "1")
 
     assert "1" not in store["tasks"]
     assert store["order"] == ["2"]
@@ -77,15 +93,15 @@ def test_delete_task():
 
 
 # mark_in_progress sets status and refreshes updatedAt.
-def test_mark_in_progress():
-    store = {"nextId": 1, "order": [], "tasks": {}}
-    add_task(store, "Status change")
+def test_mark_in_progress(tracker: TaskTracker):
+    store = tracker.store
+    add_task(tracker, "Status change")
 
     old_timestamp = "2000-01-01T00:00:00+00:00"
     store["tasks"]["1"]["createdAt"] = old_timestamp
     store["tasks"]["1"]["updatedAt"] = old_timestamp
 
-    mark_in_progress(store, "1")
+    mark_in_progress(tracker, "1")
 
     record = store["tasks"]["1"]
     assert record["status"] == "in-progress"
@@ -95,15 +111,15 @@ def test_mark_in_progress():
 
 
 # mark_done sets status to done and refreshes updatedAt.
-def test_mark_done():
-    store = {"nextId": 1, "order": [], "tasks": {}}
-    add_task(store, "Finish it")
+def test_mark_done(tracker: TaskTracker):
+    store = tracker.store
+    add_task(tracker, "Finish it")
 
     old_timestamp = "2000-01-01T00:00:00+00:00"
     store["tasks"]["1"]["createdAt"] = old_timestamp
     store["tasks"]["1"]["updatedAt"] = old_timestamp
 
-    mark_done(store, "1")
+    mark_done(tracker, "1")
 
     record = store["tasks"]["1"]
     assert record["status"] == "done"
@@ -113,24 +129,24 @@ def test_mark_done():
 
 
 # list_tasks prints all tasks and supports status/date filtering.
-def test_list_tasks(capsys):
-    store = {"nextId": 1, "order": [], "tasks": {}}
+def test_list_tasks(tracker: TaskTracker, capsys):
+    store = tracker.store
 
     # Empty store should print fallback message
-    list_task(store)
+    list_task(tracker)
     output = capsys.readouterr().out
     assert "No Tasks Yet!" in output
 
     # Invalid filters should raise errors
     with pytest.raises(ValueError):
-        list_task(store, status="blocked")
+        list_task(tracker, status="blocked")
     with pytest.raises(ValueError):
-        list_task(store, date="2026-13-01")
+        list_task(tracker, date="2026-13-01")
 
     # Add sample tasks
-    add_task(store, "Alpha")
-    add_task(store, "Beta")
-    add_task(store, "Gamma")
+    add_task(tracker, "Alpha")
+    add_task(tracker, "Beta")
+    add_task(tracker, "Gamma")
     capsys.readouterr()  # Clear output from add_task
 
     # Manually set task metadata for deterministic filtering
@@ -143,43 +159,84 @@ def test_list_tasks(capsys):
     store["tasks"]["3"]["status"] = "done"
     store["tasks"]["3"]["createdAt"] = "2025-12-31T10:00:00+00:00"
     store["tasks"]["3"]["updatedAt"] = "2025-12-31T10:00:00+00:00"
+    save_tasks(store, tracker.path)
 
     # Listing without filters should include all tasks
-    list_task(store)
+    list_task(tracker)
     output = capsys.readouterr().out
     assert "Alpha" in output
     assert "Beta" in output
     assert "Gamma" in output
 
     # Status filter should only show matching tasks
-    list_task(store, status="done")
+    list_task(tracker, status="done")
     output = capsys.readouterr().out
     assert "Gamma" in output
     assert "Alpha" not in output
     assert "Beta" not in output
 
     # Date filter should include tasks created on or after cutoff
-    list_task(store, date=">=2026-02-01")
+    list_task(tracker, date=">=2026-02-01")
     output = capsys.readouterr().out
     assert "Alpha" in output
     assert "Beta" not in output
     assert "Gamma" not in output
 
     # Combined status + date filter
-    list_task(store, status="in-progress", date="<=2026-01")
+    list_task(tracker, status="in-progress", date="<=2026-01")
     output = capsys.readouterr().out
     assert "Beta" in output
     assert "Alpha" not in output
     assert "Gamma" not in output
 
     # task_id filter should show only the requested task
-    list_task(store, task_id="2")
+    list_task(tracker, task_id="2")
     output = capsys.readouterr().out
     assert "Beta" in output
     assert "Alpha" not in output
     assert "Gamma" not in output
 
 
+# count_tasks tallies tasks per status with a total.
+def test_count_tasks():
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    assert count_tasks(store) == {"todo": 0, "in-progress": 0, "done": 0, "Total": 0}
+
+    create_task(store, "Alpha")
+    create_task(store, "Beta")
+    create_task(store, "Gamma")
+    edit_task(store, "2", status="done")
+    edit_task(store, "3", status="in-progress")
+
+    assert count_tasks(store) == {"todo": 1, "in-progress": 1, "done": 1, "Total": 3}
+
+
+# list_stores/stats_stores merge every store and isolate per-store errors.
+def test_multi_store_queries(tmp_path: Path, capsys):
+    for name, descriptions in (("b", ["Beta"]), ("a", ["Alpha", "Alpine"])):
+        store = {"nextId": 1, "order": [], "tasks": {}}
+        for description in descriptions:
+            create_task(store, description)
+        save_tasks(store, tmp_path / f"{name}.json")
+    bad_path = tmp_path / "bad.json"
+    bad_path.write_text("{", encoding="utf-8")
+    paths = [tmp_path / "b.json", bad_path, tmp_path / "a.json"]
+    capsys.readouterr()
+
+    assert list_stores(paths) is False
+    captured = capsys.readouterr()
+    assert captured.out.index("Alpha") < captured.out.index("Alpine") < captured.out.index("Beta")
+    assert "bad.json" in captured.err
+
+    assert stats_stores(paths[::2]) is True
+    output = capsys.readouterr().out
+    assert "Total" in output
+    assert "a.json" in output and "b.json" in output
+
+    with pytest.raises(ValueError):
+        list_stores(paths, status="blocked")
+
+
 # add_query registers decorated functions with parsed metadata.
 def test_add_query():
     assert "update" in queries
@@ -263,3 +320,17 @@ def test_get_date_filter():
     # Invalid operator should raise ValueError.
     with pytest.raises(ValueError):
         get_date_filter("=>2026-01-01")
+
+
+# A CLI write whose history append fails still prints the task, then warns, and exits 0.
+def test_cli_history_failure(tmp_path: Path, monkeypatch, capsys):
+    path = tmp_path / "tasks.json"
+    history_path(path).mkdir()  # Appending to the history fails
+    monkeypatch.setattr(sys, "argv", ["tasker", "--store", str(path), "add", "Alpha"])
+
+    main.main()
+
+    captured = capsys.readouterr()
+    assert "Alpha" in captured.out
+    assert captured.err.startswith("Warning: The change was saved, but not recorded in the history")
+    assert read_store(path)["order"] == ["1"]
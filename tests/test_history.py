@@ -0,0 +1,146 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import history
+from api import TaskTracker
+from commands import create_task, edit_task, history_task, remove_task
+from history import checkpoint_index_path, history_path, record_history, snapshot_store, store_as_of
+from store import save_tasks
+
+
+def _mutate(path: Path, store: dict, command, *args, **kwargs) -> None:
+    before = snapshot_store(store)
+    command(store, *args, **kwargs)
+    save_tasks(store, path)
+    record_history(path, before, store)
+
+
+def _set_entry_times(path: Path, times: list[str]) -> None:
+    entries = [json.loads(line) for line in history_path(path).read_text(encoding="utf-8").splitlines()]
+    for entry, at in zip(entries, times):
+        entry["at"] = at
+    history_path(path).write_text("".join(json.dumps(entry) + "\n" for entry in entries), encoding="utf-8")
+
+
+# record_history appends compact per-task deltas after an initial checkpoint.
+def test_record_history(tmp_path: Path, capsys):
+    path = tmp_path / "tasks.json"
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    _mutate(path, store, create_task, "Alpha")
+    _mutate(path, store, edit_task, "1", status="done")
+    _mutate(path, store, remove_task, "1")
+
+    entries = [json.loads(line) for line in history_path(path).read_text(encoding="utf-8").splitlines()]
+    assert entries[0]["checkpoint"] == {"nextId": 1, "order": [], "tasks": {}}
+    assert [entry["op"] for entry in entries[1:]] == ["add", "update", "delete"]
+    assert entries[1]["set"]["description"] == "Alpha"
+    assert entries[2]["set"]["status"] == "done"
+    assert "description" not in entries[2]["set"]
+
+    capsys.readouterr()
+    history_task(TaskTracker(path), "1")
+    output = capsys.readouterr().out
+    assert "add" in output and "update" in output and "delete" in output
+    with pytest.raises(KeyError):
+        history_task(TaskTracker(path), "2")
+
+
+# store_as_of replays deltas up to the cutoff from the nearest checkpoint.
+def test_store_as_of(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(history, "CHECKPOINT_INTERVAL", 2)
+    path = tmp_path / "tasks.json"
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    _mutate(path, store, create_task, "Alpha")
+    _mutate(path, store, create_task, "Beta")
+    _mutate(path, store, edit_task, "1", description="Alpha v2")
+    # checkpoint(empty), add 1, add 2, checkpoint, update 1
+    _set_entry_times(
+        path,
+        [
+            "2026-01-01T00:00:00+00:00",
+            "2026-01-01T00:00:00+00:00",
+            "2026-02-01T00:00:00+00:00",
+            "2026-02-01T00:00:00+00:00",
+            "2026-03-01T12:00:00+00:00",
+        ],
+    )
+
+    assert store_as_of(path, "2026-01-15")["order"] == ["1"]
+    february = store_as_of(path, "2026-02-28")
+    assert february["order"] == ["1", "2"]
+    assert february["nextId"] == 3
+    assert february["tasks"]["1"]["description"] == "Alpha"
+    assert store_as_of(path, "2026-03-01")["tasks"]["1"]["description"] == "Alpha v2"
+    assert store_as_of(path, "2026-03-01T11:00:00")["tasks"]["1"]["description"] == "Alpha"
+
+    with pytest.raises(ValueError):
+        store_as_of(path, "2025-12-31")
+    with pytest.raises(ValueError):
+        store_as_of(path, "March")
+
+
+# store_as_of skips deltas for tasks it doesn't know about instead of crashing.
+def test_store_as_of_tolerates_conflicting_deltas(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    _mutate(path, store, create_task, "Alpha")
+    # Deltas a racing writer could log: an update and delete of a task this log never added
+    with history_path(path).open("a", encoding="utf-8") as file:
+        file.write(json.dumps({"at": "2000-01-01T00:00:00+00:00", "op": "update", "id": "7", "set": {}}) + "\n")
+        file.write(json.dumps({"at": "2000-01-01T00:00:00+00:00", "op": "delete", "id": "8"}) + "\n")
+    _set_entry_times(path, ["2026-01-01T00:00:00+00:00"] * 4)
+
+    assert store_as_of(path, "2099-01-01")["order"] == ["1"]
+
+
+# store_as_of seeks to the nearest indexed checkpoint without decoding earlier lines.
+def test_store_as_of_uses_checkpoint_index(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(history, "CHECKPOINT_INTERVAL", 2)
+    path = tmp_path / "tasks.json"
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    _mutate(path, store, create_task, "Alpha")
+    _mutate(path, store, create_task, "Beta")
+    _mutate(path, store, create_task, "Gamma")
+    offsets = [json.loads(line)["offset"] for line in checkpoint_index_path(path).read_text().splitlines()]
+    assert offsets[0] == 0 and len(offsets) == 2
+
+    # Corrupt everything before the second checkpoint: only the index can get past it
+    data = history_path(path).read_bytes()
+    history_path(path).write_bytes(b"x" * (offsets[1] - 1) + b"\n" + data[offsets[1] :])
+
+    assert store_as_of(path, "2099-01-01")["order"] == ["1", "2", "3"]
+
+
+# An edit that shifts the history's lines makes store_as_of rescan instead of failing.
+def test_store_as_of_stale_checkpoint_index(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(history, "CHECKPOINT_INTERVAL", 3)
+    tracker = TaskTracker(tmp_path / "tasks.json")
+    for i in range(8):
+        tracker.add(f"Task {i}")
+
+    lines = history_path(tracker.path).read_text(encoding="utf-8").splitlines(keepends=True)
+    assert '"op": "add"' in lines[1]
+    history_path(tracker.path).write_text("".join(lines[:1] + lines[2:]), encoding="utf-8")
+
+    # Task 1's add is gone, but the later checkpoints still hold it
+    assert [task["id"] for task in tracker.list(as_of="2099-01-01")] == [str(i) for i in range(1, 9)]
+
+
+# Starting a new history file also restarts its checkpoint index.
+def test_record_history_restarts_checkpoint_index(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(history, "CHECKPOINT_INTERVAL", 2)
+    tracker = TaskTracker(tmp_path / "tasks.json")
+    for i in range(4):
+        tracker.add(f"Task {i}")
+    history_path(tracker.path).unlink()
+
+    tracker.add("After reset")
+
+    data = history_path(tracker.path).read_bytes()
+    index = [json.loads(line) for line in checkpoint_index_path(tracker.path).read_text().splitlines()]
+    assert index[0]["offset"] == 0
+    assert all(data[item["offset"] :].startswith(b'{"at": "') for item in index)
+    assert all(b'"checkpoint"' in data[item["offset"] :].split(b"\n", 1)[0] for item in index)
+    assert len(tracker.list(as_of="2099-01-01")) == 5
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+from loadtest import _parse_mix, _summarize, run_load_test
+
+
+# run_load_test drives main.main() from several processes and checks the final store.
+def test_run_load_test(tmp_path: Path):
+    report = run_load_test(tmp_path / "tasks.json", processes=2, ops=10, seed_tasks=5, sample_interval=0.01)
+
+    assert report["latency_ms"]["all"]["count"] == 20
+    assert sum(report["latency_ms"][op]["count"] for op in ("add", "update", "mark-done", "delete", "list")) == 20
+    assert report["throughput_ops_s"] > 0
+    integrity = report["integrity"]
+    assert integrity["invariants_ok"] is True
+    assert integrity["next_id"] <= integrity["expected_next_id"]
+    assert report["file_size"][-1]["store_bytes"] > 0
+
+
+# A single worker has no concurrent saves to lose, even when it updates or deletes its own adds.
+def test_run_load_test_single_process(tmp_path: Path):
+    report = run_load_test(tmp_path / "tasks.json", processes=1, ops=200, seed_tasks=5, sample_interval=0.01)
+
+    integrity = report["integrity"]
+    assert integrity["lost_adds"] == 0
+    assert integrity["lost_deletes"] == 0
+    assert integrity["next_id"] == integrity["expected_next_id"]
+
+
+# _summarize uses nearest-rank percentiles.
+def test_summarize():
+    assert _summarize([]) == {"count": 0}
+    summary = _summarize([float(i) for i in range(1, 101)])
+    assert summary == {"count": 100, "p50": 50.0, "p95": 95.0, "p99": 99.0}
+
+
+# _parse_mix accepts 'op=weight' pairs for known commands only.
+def test_parse_mix():
+    assert _parse_mix("add=1, list=3") == {"add": 1, "list": 3}
+    with pytest.raises(ValueError):
+        _parse_mix("archive=1")
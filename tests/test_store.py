@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from store import load_tasks, save_tasks
+from store import StoreError, find_stores, load_tasks, read_generation, read_store, save_tasks
 
 
 # load_tasks tests
@@ -36,6 +36,33 @@ def test_load_tasks_rejects_invalid_shape(tmp_path: Path):
     assert excinfo.value.code == 1
 
 
+def test_read_store_raises_store_error(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    path.write_text("[]", encoding="utf-8")
+
+    with pytest.raises(StoreError) as excinfo:
+        read_store(path)
+    assert excinfo.value.exit_code == 1
+
+
+def test_read_store_reuses_unchanged_records(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    record = {
+        "description": "Write tests",
+        "status": "todo",
+        "createdAt": "2026-02-01T08:00:00+00:00",
+        "updatedAt": "2026-02-01T08:00:00+00:00",
+    }
+    save_tasks({"nextId": 3, "order": ["1", "2"], "tasks": {"1": record, "2": dict(record)}}, path)
+    previous = read_store(path)
+    save_tasks({"nextId": 3, "order": ["1", "2"], "tasks": {"1": record, "2": {**record, "status": "done"}}}, path)
+
+    store = read_store(path, previous=previous)
+
+    assert store["tasks"]["1"] is previous["tasks"]["1"]
+    assert store["tasks"]["2"]["status"] == "done"
+
+
 # save_tasks tests
 def test_save_tasks_writes_json(tmp_path: Path):
     path = tmp_path / "tasks.json"
@@ -56,3 +83,22 @@ def test_save_tasks_writes_json(tmp_path: Path):
 
     data = json.loads(path.read_text(encoding="utf-8"))
     assert data == store
+
+
+def test_save_tasks_bumps_generation(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    assert read_generation(path) == 0
+
+    store = load_tasks(path)
+    assert read_generation(path) == 1
+    save_tasks(store, path)
+    assert read_generation(path) == 2
+
+
+def test_find_stores_skips_sidecars(tmp_path: Path):
+    for name in ("a.json", "b.json"):
+        save_tasks({"nextId": 1, "order": [], "tasks": {}}, tmp_path / name)
+    for sidecar in ("a.json.cache", "a.json.history"):
+        (tmp_path / sidecar).write_text("{}", encoding="utf-8")
+
+    assert sorted(path.name for path in find_stores(str(tmp_path / "*"))) == ["a.json", "b.json"]
@@ -0,0 +1,76 @@
+import io
+import sys
+from pathlib import Path
+
+import main
+from commands import _watch_renderer, create_task, edit_task
+from store import save_tasks
+from watch import _redraw, watch_store
+
+
+class _FakeTerminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+# watch_store re-renders on every save, passing only the changed task IDs.
+def test_watch_store(tmp_path: Path):
+    path = tmp_path / "tasks.json"
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    create_task(store, "Alpha")
+    create_task(store, "Beta")
+    save_tasks(store, path)
+    seen: list[set] = []
+
+    def render(current, changed):
+        seen.append(changed)
+        if len(seen) == 1:
+            # Another process edits the store while we are watching
+            edit_task(store, "2", status="done")
+            save_tasks(store, path)
+        return f"{len(current['tasks'])} tasks"
+
+    out = io.StringIO()
+    watch_store(path, render, interval=0.01, out=out, max_updates=2)
+
+    assert seen == [{"1", "2"}, {"2"}]
+    assert out.getvalue() == "2 tasks\n\n2 tasks\n\n"
+
+
+# _redraw rewrites only the terminal lines that changed.
+def test_redraw_only_changed_lines():
+    out = _FakeTerminal()
+    screen = _redraw(out, [], ["a", "b", "c"])
+    out.seek(0)
+    out.truncate()
+
+    _redraw(out, screen, ["a", "B"])
+
+    assert out.getvalue() == "\x1b[3F" + "\x1b[1E" + "\x1b[2KB\n" + "\x1b[J"
+
+
+# A watched --task-id that doesn't exist gets plain list's message instead of "No Tasks Yet!".
+def test_watch_renderer_missing_task():
+    store = {"nextId": 1, "order": [], "tasks": {}}
+    create_task(store, "Alpha")
+    render = _watch_renderer("2", "all", None)
+
+    assert render(store, {"1"}) == "Task with ID 2 does not exist."
+    create_task(store, "Beta")
+    assert "Beta" in render(store, {"2"})
+
+
+# list --watch hands the store path to watch_store without the tracker loading the store.
+def test_main_watch_skips_tracker_load(tmp_path: Path, monkeypatch):
+    path = tmp_path / "tasks.json"
+    watched = []
+
+    def no_load(*args):
+        raise AssertionError("TaskTracker loaded the store")
+
+    monkeypatch.setattr("api.read_store", no_load)
+    monkeypatch.setattr("commands.watch_store", lambda store_path, render: watched.append(store_path))
+    monkeypatch.setattr(sys, "argv", ["tasker", "--store", str(path), "list", "--watch"])
+    main.main()
+
+    assert watched == [path.resolve()]
@@ -0,0 +1,81 @@
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional, TextIO
+
+from cache import StoreStamp, store_stamp
+from models import TASK_ID, Store, TaskRecord
+from store import StoreError, read_store
+
+WATCH_INTERVAL = 0.5  # Seconds between checks of the store's stamp
+
+StoreRenderer = Callable[[Store, set[TASK_ID]], str]
+
+
+def watch_store(
+    store_path: Path,
+    render: StoreRenderer,
+    interval: float = WATCH_INTERVAL,
+    out: TextIO = sys.stdout,
+    max_updates: Optional[int] = None,
+) -> None:
+    """
+    Print render(store, changed_ids) and redraw it every time the store changes, until interrupted.
+
+    Polls store_stamp() (save generation, mtime, size), so an unchanged store costs one
+    stat() and one tiny read per interval and is never parsed. On a change, only the IDs of
+    records that were added, edited or deleted since the last load are passed to render, and
+    on a terminal only the output lines that differ are rewritten.
+    max_updates stops after that many renders (for tests).
+    """
+    store: Optional[Store] = None
+    screen: list[str] = []
+    stamp: Optional[StoreStamp] = None
+    updates = 0
+    try:
+        while max_updates is None or updates < max_updates:
+            new_stamp = store_stamp(store_path)
+            if updates == 0 or new_stamp != stamp:
+                stamp = new_stamp
+                try:
+                    new_store = read_store(store_path, previous=store)
+                except StoreError as e:
+                    output = f"Error: {e}"
+                else:
+                    changed = _changed_ids(store["tasks"] if store else {}, new_store["tasks"])
+                    store = new_store
+                    output = render(store, changed)
+                screen = _redraw(out, screen, output.splitlines())
+                updates += 1
+                continue  # Re-check at once in case the store changed while loading
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _changed_ids(old: dict[TASK_ID, TaskRecord], new: dict[TASK_ID, TaskRecord]) -> set[TASK_ID]:
+    # Unchanged records are the same objects (see read_store(previous=...)), so this is cheap
+    changed = {id for id, record in new.items() if old.get(id) is not record}
+    changed.update(id for id in old if id not in new)
+    return changed
+
+
+def _redraw(out: TextIO, old_lines: list[str], new_lines: list[str]) -> list[str]:
+    """Replace the previously drawn lines with new_lines, touching only lines that changed."""
+    if not out.isatty():
+        out.write("\n".join(new_lines) + "\n\n")
+    elif not old_lines or len(old_lines) >= shutil.get_terminal_size().lines:
+        # Nothing drawn yet, or the old output scrolled past the top: start from a clean screen
+        out.write("\x1b[H\x1b[2J" + "\n".join(new_lines) + "\n")
+    else:
+        out.write(f"\x1b[{len(old_lines)}F")  # Back to the first drawn line
+        for i, line in enumerate(new_lines):
+            if i < len(old_lines) and old_lines[i] == line:
+                out.write("\x1b[1E")  # Unchanged: skip to the next line
+            else:
+                out.write("\x1b[2K" + line + "\n")
+        if len(new_lines) < len(old_lines):
+            out.write("\x1b[J")  # Clear leftover lines
+    out.flush()
+    return new_lines